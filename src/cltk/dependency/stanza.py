@@ -2,12 +2,19 @@
 About: `<https://github.com/stanfordnlp/stanza>`_.
 """
 
+import hashlib
 import logging
+import multiprocessing
 import os
-from typing import Dict, Optional
+import queue
+import sys
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import stanza  # type: ignore
+from boltons.cacheutils import cachedproperty
 from stanza.models.common.constant import lang2lcode  # Dict[str, str]
+from stanza.models.common.doc import Document
 from stanza.resources.prepare_resources import default_treebanks  # Dict[str, str]
 
 from cltk.core.exceptions import (
@@ -31,11 +38,107 @@ MAP_LANGS_CLTK_STANZA = {
     "lzh": "Classical_Chinese",
 }
 
+# Composition of ``MAP_LANGS_CLTK_STANZA`` with Stanza's
+# ``lang2lcode`` (e.g., ``{"grc": "grc", "lat": "la", ...}``),
+# flattened once at import so ``_get_stanza_code()`` is a single
+# dict lookup instead of two.
+CLTK_TO_STANZA_CODE = {
+    cltk_lang: lang2lcode[stanza_lang_name]
+    for cltk_lang, stanza_lang_name in MAP_LANGS_CLTK_STANZA.items()
+    if stanza_lang_name in lang2lcode
+}
+
+# User-facing download messages, built once at import; each is
+# emitted with a single ``print()`` call.
+DOWNLOAD_NOTICE = (
+    "CLTK message: This part of the CLTK depends upon the Stanza NLP library."
+)
+DOWNLOAD_MESSAGE_TEMPLATE = (
+    "CLTK message: Going to download required Stanza models to ``{}`` ..."
+)
+
+# Snapshot of Stanza's default treebank per language code, taken once
+# at import so construction does not re-read it through the ``stanza``
+# module on every call (and is insulated from any future lazy-loading
+# there).
+DEFAULT_TREEBANKS = dict(default_treebanks)  # type: Dict[str, str]
+
+# Optional treebanks available per Stanza language code; ``frozenset``
+# for O(1) membership tests and safe sharing across all instances.
+# TODO: Write tests for all treebanks
+MAP_CODE_TREEBANKS = dict(
+    grc=frozenset(["proiel", "perseus"]),
+    la=frozenset(["perseus", "proiel", "ittb"]),
+)
+
+# Where Stanza keeps its downloaded models; expanded once at import
+# rather than per wrapper construction.
+STANZA_RESOURCES_DIR = os.path.expanduser("~/stanza_resources/")
+
+# Stanza >= 1.2 pipelines a list of ``Document`` objects passed to
+# ``Pipeline.__call__``/``process`` in one call, mini-batching
+# internally across the neural processors (the processors' own
+# ``bulk_process`` is dispatched from there; ``Pipeline`` itself only
+# grew a ``bulk_process`` method much later). Detected once at import
+# by version; where absent, ``parse_many()`` falls back to the
+# join-and-split batching below.
+try:
+    _STANZA_VERSION = tuple(
+        int(part) for part in stanza.__version__.split(".")[:2]
+    )
+except (AttributeError, ValueError):
+    _STANZA_VERSION = (0, 0)
+SUPPORTS_BULK_PROCESS = _STANZA_VERSION >= (1, 2)
+
+# Marker inserted between documents when several texts are
+# sent through the pipeline in a single call. The surrounding
+# blank lines guarantee that Stanza segments the marker into
+# a sentence of its own, which ``parse_many()`` then discards.
+DOC_SEPARATOR_MARKER = "###CLTKDOC###"
+DOC_SEPARATOR = f"\n\n{DOC_SEPARATOR_MARKER}\n\n"
+
+
+def _run_pipeline_worker(wrapper_kwargs, request_queue, reply_queue) -> None:
+    """Entry point for the child process spawned in ``server_mode``.
+
+    Holds the single GPU-resident pipeline and serves parse requests
+    (lists of texts) from ``request_queue``, replying with serialized
+    ``Document`` payloads. A ``None`` request shuts the worker down.
+    """
+    wrapper = StanzaWrapper(**wrapper_kwargs)
+    while True:
+        texts = request_queue.get()
+        if texts is None:
+            request_queue.task_done()
+            break
+        try:
+            documents = wrapper.parse_many(texts)
+            reply_queue.put(
+                [(document.to_dict(), document.text) for document in documents]
+            )
+        except Exception as error:  # relay the failure to the caller
+            reply_queue.put(error)
+        request_queue.task_done()
+
 
 class StanzaWrapper:
     """CLTK's wrapper for the Stanza project."""
 
-    nlps = {}
+    # LRU cache of constructed wrappers, keyed by ``(language, treebank)``
+    # so several treebanks for one language can coexist. Bounded so a
+    # long-running process cannot accumulate pipelines without limit.
+    nlps = OrderedDict()  # type: OrderedDict
+    max_cached_nlps = 10  # type: int
+
+    # Model paths already confirmed present on disk. Once a model file
+    # exists it never disappears within a process's lifetime, so a set
+    # lookup here replaces a stat() syscall on every construction.
+    _model_present_cache = set()  # type: set
+
+    # Cached listing of each language's ``tokenize`` model directory,
+    # so preloading many languages costs one directory read apiece
+    # instead of one stat() per model file.
+    _model_dir_cache = dict()  # type: Dict[str, frozenset]
 
     def __init__(
         self,
@@ -44,6 +147,11 @@ class StanzaWrapper:
         stanza_debug_level="ERROR",
         interactive: bool = True,
         silent: bool = False,
+        server_mode: bool = False,
+        processors: Optional[str] = None,
+        half_precision: bool = False,
+        mixed_device: bool = False,
+        cache_bytes: int = 256 * 1024 * 1024,
     ) -> None:
         """Constructor for ``get_stanza_models`` wrapper class.
 
@@ -62,6 +170,16 @@ class StanzaWrapper:
         'grc'
         >>> stanza_wrapper.treebank
         'perseus'
+
+        A comma-separated ``processors`` string restricts the pipeline
+        to the named stages; e.g., ``"tokenize"`` loads a pipeline
+        several times lighter than the full parsing stack, for
+        segmentation-only workloads.
+
+        >>> tokenize_only_wrapper = StanzaWrapper(language="grc", stanza_debug_level="INFO", interactive=False, silent=True, processors="tokenize")
+        >>> tokenize_only_wrapper.processors
+        'tokenize'
+
         >>> from cltk.languages.example_texts import get_example_text
         >>> stanza_doc = stanza_wrapper.parse(get_example_text("grc"))
 
@@ -98,6 +216,33 @@ class StanzaWrapper:
         self.stanza_debug_level = stanza_debug_level
         self.interactive = interactive
         self.silent = silent
+        # optional override of which pipeline stages to load;
+        # ``None`` means the full default stack for the language
+        self.processors = processors
+        # With CUDA, run the processors' models in FP16 for roughly
+        # double the inference throughput and half the VRAM; ignored
+        # on CPU. Conversion falls back to FP32 per processor if a
+        # model does not tolerate half-precision.
+        self.half_precision = half_precision
+        # Keep the tokenizer on CPU while the heavier neural stages
+        # run on GPU. Tokenization is dominated by kernel-launch and
+        # host-device transfer overhead on the short texts typical of
+        # classical corpora, so pinning it to CPU saves a round-trip
+        # per call. Ignored without CUDA.
+        self.mixed_device = mixed_device
+        # LRU cache of parsed results keyed by a hash of the input
+        # text, for workflows that re-parse a fixed corpus. Bounded by
+        # ``cache_bytes`` (approximated by the inputs' string sizes)
+        # so repeated parses cannot grow memory without limit.
+        self._parse_cache = OrderedDict()  # type: OrderedDict
+        self._parse_cache_budget = cache_bytes
+        self._parse_cache_size = 0
+        # ``server_mode`` keeps the pipeline in one persistent child
+        # process, so multi-worker deployments share a single copy of
+        # the model weights on the GPU. Only worthwhile with CUDA;
+        # on CPU the pipeline stays in-process.
+        self.server_mode = server_mode and self._is_cuda_available()
+        self._worker = None  # type: Optional[multiprocessing.Process]
 
         if self.interactive and self.silent:
             raise ValueError(
@@ -114,10 +259,7 @@ class StanzaWrapper:
         self.stanza_code = self._get_stanza_code()
 
         # Setup optional treebank if specified
-        # TODO: Write tests for all treebanks
-        self.map_code_treebanks = dict(
-            grc=["proiel", "perseus"], la=["perseus", "proiel", "ittb"]
-        )
+        self.map_code_treebanks = MAP_CODE_TREEBANKS
         # if not specified, will use the default treebank chosen by stanza
         if self.treebank:
             valid_treebank = self._is_valid_treebank()
@@ -131,25 +273,46 @@ class StanzaWrapper:
         # check if model present
         # this fp is just to confirm that some model has already been downloaded.
         # TODO: This is a weak check for the models actually being downloaded and valid
-        # TODO: Use ``models_dir`` var from below and make self. or global to module
-        self.model_path = os.path.expanduser(
-            f"~/stanza_resources/{self.stanza_code}/tokenize/{self.treebank}.pt"
+        self.model_path = os.path.join(
+            STANZA_RESOURCES_DIR, f"{self.stanza_code}/tokenize/{self.treebank}.pt"
         )
         if not self._is_model_present():
             # download model if necessary
             self._download_model()
 
-        # instantiate actual stanza class
-        # Note: `suppress_stdout` is used to prevent `stanza`
-        # from printing a long log of its parameters to screen.
-        # Though we should capture these, within `_load_pipeline()`,
-        # for the log file.
+        if self.server_mode:
+            self._start_worker()
+        # Note: the in-process pipeline itself is loaded lazily, upon
+        # first access of ``self.nlp``. See the ``nlp`` property below.
+
+    @cachedproperty
+    def nlp(self):
+        """The wrapped ``stanza.Pipeline``, instantiated upon first
+        access rather than at construction time, so code paths that
+        only inspect wrapper metadata (e.g., ``treebank``) do not pay
+        the multi-second model load. ``preload()`` forces evaluation
+        for callers who want the cost up front.
+
+        Note: `suppress_stdout` is used to prevent `stanza`
+        from printing a long log of its parameters to screen.
+        Though we should capture these, within `_load_pipeline()`,
+        for the log file.
+
+        >>> stanza_wrapper = StanzaWrapper(language="grc", stanza_debug_level="INFO", interactive=False, silent=True)
+        >>> isinstance(stanza_wrapper.nlp, stanza.pipeline.core.Pipeline)
+        True
+        """
         with suppress_stdout():
-            self.nlp = self._load_pipeline()
+            return self._load_pipeline()
 
-    def parse(self, text: str):
+    def parse(self, text: str, use_cache: bool = True):
         """Run all available ``stanza`` parsing on input text.
 
+        Results are memoized by a hash of the input, so re-parsing an
+        identical string (common when analyses are re-run over a fixed
+        corpus) returns the cached ``Document`` without touching the
+        pipeline; pass ``use_cache=False`` for truly one-shot calls.
+
         >>> from cltk.languages.example_texts import get_example_text
         >>> stanza_wrapper = StanzaWrapper(language='grc', stanza_debug_level="INFO", interactive=False, silent=True)
         >>> greek_nlp = stanza_wrapper.parse(get_example_text("grc"))
@@ -218,9 +381,245 @@ class StanzaWrapper:
         >>> first_word.pos
         'ADV'
         """
-        parsed_text = self.nlp(text)
+        if use_cache:
+            cache_key = hashlib.blake2b(
+                text.encode("utf-8"), digest_size=16
+            ).digest()
+            cached_document = self._parse_cache.get(cache_key)
+            if cached_document is not None:
+                self._parse_cache.move_to_end(cache_key)
+                return cached_document[0]
+        if self.server_mode:
+            parsed_text = self._dispatch_to_worker([text])[0]
+        elif SUPPORTS_BULK_PROCESS:
+            parsed_text = self.nlp([Document([], text=text)])[0]
+        else:
+            parsed_text = self.nlp(text)
+        if use_cache:
+            # ``getsizeof`` of the input is a cheap proxy for the
+            # entry's true footprint; it keeps eviction O(1) without
+            # walking the parsed ``Document``.
+            entry_size = sys.getsizeof(text)
+            self._parse_cache[cache_key] = (parsed_text, entry_size)
+            self._parse_cache_size += entry_size
+            while (
+                self._parse_cache_size > self._parse_cache_budget
+                and self._parse_cache
+            ):
+                _, (_, evicted_size) = self._parse_cache.popitem(last=False)
+                self._parse_cache_size -= evicted_size
         return parsed_text
 
+    def parse_many(self, texts: List[str]) -> List[Document]:
+        """Run ``stanza`` parsing on many input texts with a single
+        call into the pipeline, yielding one ``Document`` per input.
+        On Stanza >= 1.2 this uses the pipeline's native bulk
+        interface; otherwise the texts are joined with a unique
+        separator, parsed in one pass, then split back apart. Either
+        way the pipeline's fixed per-call costs are amortized across
+        the whole batch, which matters for workloads of many short
+        documents.
+
+        >>> from cltk.languages.example_texts import get_example_text
+        >>> stanza_wrapper = StanzaWrapper(language='grc', stanza_debug_level="INFO", interactive=False, silent=True)
+        >>> docs = stanza_wrapper.parse_many([get_example_text("grc"), get_example_text("grc")])
+        >>> len(docs)
+        2
+        >>> from stanza.models.common.doc import Document
+        >>> isinstance(docs[0], Document)
+        True
+        >>> docs[0].sentences[0].tokens[0].start_char == docs[1].sentences[0].tokens[0].start_char
+        True
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        if self.server_mode:
+            return self._dispatch_to_worker(texts)
+        if SUPPORTS_BULK_PROCESS:
+            # Submit the texts sorted by length so Stanza's internal
+            # mini-batches are length-homogeneous: the transformer
+            # processors pad each batch to its longest member, so
+            # mixing short and long texts wastes compute on padding.
+            # The output list is restored to input order.
+            order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+            parsed_sorted = self.nlp(
+                [Document([], text=texts[index]) for index in order]
+            )
+            documents = [None] * len(texts)  # type: List[Optional[Document]]
+            for sorted_position, original_index in enumerate(order):
+                documents[original_index] = parsed_sorted[sorted_position]
+            return documents
+        if len(texts) == 1:
+            return [self.parse(texts[0])]
+        # Fallback for Stanza builds without ``bulk_process``: join the
+        # texts around a sentence-isolated marker, parse once, split.
+        # Character offset at which each input begins within the joined string
+        offsets = list()  # type: List[int]
+        running_offset = 0
+        for text in texts:
+            offsets.append(running_offset)
+            running_offset += len(text) + len(DOC_SEPARATOR)
+        parsed_batch = self.nlp(DOC_SEPARATOR.join(texts))
+        documents = list()  # type: List[Document]
+        pending_sentences = list()
+        for sentence in parsed_batch.sentences:
+            if sentence.text == DOC_SEPARATOR_MARKER:
+                documents.append(
+                    self._rebase_document(
+                        pending_sentences,
+                        texts[len(documents)],
+                        offsets[len(documents)],
+                    )
+                )
+                pending_sentences = list()
+            else:
+                pending_sentences.append(sentence)
+        documents.append(
+            self._rebase_document(
+                pending_sentences, texts[len(documents)], offsets[len(documents)]
+            )
+        )
+        return documents
+
+    def parse_stream(
+        self, texts: Iterable[str], batch_chars: int = 12000
+    ) -> Iterator[Document]:
+        """Lazily parse an iterable of texts, yielding one ``Document``
+        per input in order. Inputs are buffered until roughly
+        ``batch_chars`` characters are pending, then dispatched in one
+        batched call to ``parse_many()``. Compared to calling ``parse()``
+        in a loop, this keeps the pipeline busy on large corpora while
+        the caller's I/O (e.g., reading lines from disk) proceeds
+        between batches.
+
+        >>> from cltk.languages.example_texts import get_example_text
+        >>> stanza_wrapper = StanzaWrapper(language='grc', stanza_debug_level="INFO", interactive=False, silent=True)
+        >>> docs = list(stanza_wrapper.parse_stream([get_example_text("grc")] * 3))
+        >>> len(docs)
+        3
+        >>> from stanza.models.common.doc import Document
+        >>> all(isinstance(doc, Document) for doc in docs)
+        True
+        """
+        pending = deque()  # type: deque
+        pending_chars = 0
+        for text in texts:
+            pending.append(text)
+            pending_chars += len(text)
+            if pending_chars >= batch_chars:
+                for document in self.parse_many(list(pending)):
+                    yield document
+                pending.clear()
+                pending_chars = 0
+        if pending:
+            for document in self.parse_many(list(pending)):
+                yield document
+
+    @staticmethod
+    def _rebase_document(sentences, text: str, offset: int) -> Document:
+        """Rebuild a standalone ``Document`` from sentences parsed as
+        part of a larger joined string, shifting all character offsets
+        back so they index into ``text``.
+        """
+        sentence_dicts = list()
+        for sentence in sentences:
+            token_dicts = sentence.to_dict()
+            for token_dict in token_dicts:
+                for key in ("start_char", "end_char"):
+                    if isinstance(token_dict.get(key), int):
+                        token_dict[key] -= offset
+                misc = token_dict.get("misc")
+                if misc:
+                    rebased_fields = list()  # type: List[str]
+                    for field in misc.split("|"):
+                        name, _, value = field.partition("=")
+                        if name in ("start_char", "end_char") and value.isdigit():
+                            field = f"{name}={int(value) - offset}"
+                        rebased_fields.append(field)
+                    token_dict["misc"] = "|".join(rebased_fields)
+            sentence_dicts.append(token_dicts)
+        return Document(sentence_dicts, text=text)
+
+    @staticmethod
+    def _is_cuda_available() -> bool:
+        """Report whether a CUDA device is usable by ``torch``
+        (a Stanza dependency), without failing where it is absent.
+        """
+        try:
+            import torch  # type: ignore
+
+            return torch.cuda.is_available()
+        except ImportError:
+            return False
+
+    def _start_worker(self) -> None:
+        """Spawn the persistent child process that owns the pipeline
+        in ``server_mode``. The child constructs an ordinary in-process
+        wrapper (models are already on disk at this point, so it will
+        not prompt for downloads) and serves requests from a queue.
+        """
+        wrapper_kwargs = dict(
+            language=self.language,
+            treebank=self.treebank,
+            stanza_debug_level=self.stanza_debug_level,
+            interactive=False,
+            silent=True,
+            processors=self.processors,
+            half_precision=self.half_precision,
+            mixed_device=self.mixed_device,
+        )
+        self._request_queue = multiprocessing.JoinableQueue()
+        self._reply_queue = multiprocessing.Queue()
+        self._worker = multiprocessing.Process(
+            target=_run_pipeline_worker,
+            args=(wrapper_kwargs, self._request_queue, self._reply_queue),
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _dispatch_to_worker(self, texts: List[str]) -> List[Document]:
+        """Send texts to the ``server_mode`` worker and rebuild the
+        parsed ``Document`` objects from its serialized reply. Raises
+        ``CLTKException`` rather than blocking forever if the child
+        process has died (e.g., from a CUDA OOM) before or during the
+        request.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            raise CLTKException(
+                "The Stanza ``server_mode`` worker process is not running."
+            )
+        self._request_queue.put(texts)
+        while True:
+            try:
+                reply = self._reply_queue.get(timeout=1.0)
+                break
+            except queue.Empty:
+                if not self._worker.is_alive():
+                    raise CLTKException(
+                        "The Stanza ``server_mode`` worker process died while handling a request."
+                    )
+        if isinstance(reply, Exception):
+            raise reply
+        return [
+            Document(sentence_dicts, text=text) for sentence_dicts, text in reply
+        ]
+
+    def stop_worker(self) -> None:
+        """Shut down the ``server_mode`` child process, if running."""
+        if self._worker is not None and self._worker.is_alive():
+            self._request_queue.put(None)
+            self._worker.join()
+        self._worker = None
+
+    def __del__(self) -> None:
+        # Without this, the daemon child would outlive the wrapper
+        # until interpreter exit, holding its copy of the model.
+        try:
+            self.stop_worker()
+        except Exception:
+            pass
+
     def _load_pipeline(self):
         """Instantiate ``stanza.Pipeline()``.
 
@@ -236,18 +635,19 @@ class StanzaWrapper:
         >>> isinstance(nlp_obj, stanza.pipeline.core.Pipeline)
         True
         """
-        models_dir = os.path.expanduser(
-            "~/stanza_resources/"
-        )  # TODO: Mv this a self. var or maybe even global
-        processors = "tokenize,mwt,pos,lemma,depparse"
+        models_dir = STANZA_RESOURCES_DIR
         lemma_use_identity = False
         if self.language == "fro":
-            processors = "tokenize,pos,lemma,depparse"
             lemma_use_identity = True
-        if self.language in ["chu", "got", "grc", "lzh"]:
-            # Note: MWT not available for several languages
-            processors = "tokenize,pos,lemma,depparse"
-        nlp = stanza.Pipeline(
+        processors = self.processors
+        if processors is None:
+            processors = "tokenize,mwt,pos,lemma,depparse"
+            if self.language == "fro":
+                processors = "tokenize,pos,lemma,depparse"
+            if self.language in ["chu", "got", "grc", "lzh"]:
+                # Note: MWT not available for several languages
+                processors = "tokenize,pos,lemma,depparse"
+        pipeline_kwargs = dict(
             lang=self.stanza_code,
             dir=models_dir,
             package=self.treebank,
@@ -256,8 +656,58 @@ class StanzaWrapper:
             use_gpu=True,  # default, won't fail if GPU not present
             lemma_use_identity=lemma_use_identity,
         )
+        nlp = stanza.Pipeline(**pipeline_kwargs)
+        if self.mixed_device and self._is_cuda_available():
+            self._move_tokenizer_to_cpu(nlp)
+        if self.half_precision and self._is_cuda_available():
+            self._halve_processor_weights(nlp)
         return nlp
 
+    @staticmethod
+    def _move_tokenizer_to_cpu(nlp) -> None:
+        """Move the tokenize processor's model (and its trainer's
+        device flag) to the CPU after pipeline construction. Stanza
+        builds every processor with the pipeline-wide ``use_gpu``
+        setting and ignores per-processor device kwargs, so the
+        placement has to be applied to the loaded model directly.
+        """
+        tokenize_processor = getattr(nlp, "processors", dict()).get("tokenize")
+        trainer = getattr(tokenize_processor, "_trainer", None)
+        model = getattr(trainer, "model", None)
+        if model is None or not hasattr(model, "cpu"):
+            return
+        try:
+            model.cpu()
+            trainer.use_cuda = False
+        except Exception as error:
+            LOG.warning(
+                "Could not move the Stanza tokenizer to CPU; leaving it on GPU: %s",
+                error,
+            )
+
+    @staticmethod
+    def _halve_processor_weights(nlp) -> None:
+        """Convert each pipeline processor's model to FP16 in place.
+        Any processor whose model rejects the conversion is left in
+        FP32, since not every Stanza processor tolerates
+        half-precision activations.
+        """
+        for processor_name, processor in getattr(nlp, "processors", dict()).items():
+            model = getattr(processor, "_model", None)
+            if model is None:
+                trainer = getattr(processor, "_trainer", None)
+                model = getattr(trainer, "model", None)
+            if model is None or not hasattr(model, "half"):
+                continue
+            try:
+                model.half()
+            except Exception as error:
+                LOG.warning(
+                    "Could not convert Stanza processor '%s' to half precision; keeping FP32: %s",
+                    processor_name,
+                    error,
+                )
+
     def _is_model_present(self) -> bool:
         """Checks if the model is already downloaded.
 
@@ -265,22 +715,43 @@ class StanzaWrapper:
         >>> stanza_wrapper._is_model_present()
         True
         """
-        if file_exists(self.model_path):
+        if self.model_path in StanzaWrapper._model_present_cache:
+            return True
+        if f"{self.treebank}.pt" in self._scan_models(self.stanza_code):
+            StanzaWrapper._model_present_cache.add(self.model_path)
             return True
         return False
 
+    @classmethod
+    def _scan_models(cls, stanza_code: str) -> frozenset:
+        """Return the filenames in a language's ``tokenize`` model
+        directory, reading the directory at most once per process.
+
+        >>> isinstance(StanzaWrapper._scan_models("grc"), frozenset)
+        True
+        """
+        tokenize_dir = os.path.join(STANZA_RESOURCES_DIR, stanza_code, "tokenize")
+        if tokenize_dir not in cls._model_dir_cache:
+            try:
+                with os.scandir(tokenize_dir) as dir_entries:
+                    file_names = frozenset(
+                        entry.name for entry in dir_entries if entry.is_file()
+                    )
+            except OSError:
+                file_names = frozenset()
+            cls._model_dir_cache[tokenize_dir] = file_names
+        return cls._model_dir_cache[tokenize_dir]
+
     def _download_model(self) -> None:
         """Interface with the `stanza` model downloader."""
         if not self.interactive:
             if not self.silent:
                 print(
-                    f"CLTK message: Going to download required Stanza models to ``{self.model_path}`` ..."
+                    DOWNLOAD_MESSAGE_TEMPLATE.format(self.model_path)
                 )  # pragma: no cover
             stanza.download(lang=self.stanza_code, package=self.treebank)
         else:
-            print(  # pragma: no cover
-                "CLTK message: This part of the CLTK depends upon the Stanza NLP library."
-            )  # pragma: no cover
+            print(DOWNLOAD_NOTICE)  # pragma: no cover
             dl_is_allowed = query_yes_no(
                 f"CLTK message: Allow download of Stanza models to ``{self.model_path}``?"
             )  # type: bool
@@ -297,6 +768,9 @@ class StanzaWrapper:
                     self.model_path
                 )
             )
+        StanzaWrapper._model_present_cache.add(self.model_path)
+        # the download changed the directory contents; re-scan on next use
+        StanzaWrapper._model_dir_cache.pop(os.path.dirname(self.model_path), None)
 
     def _get_default_treebank(self) -> str:
         """Return description of a language's default treebank if none
@@ -306,8 +780,7 @@ class StanzaWrapper:
         >>> stanza_wrapper._get_default_treebank()
         'proiel'
         """
-        stanza_default_treebanks = default_treebanks  # type: Dict[str, str]
-        return stanza_default_treebanks[self.stanza_code]
+        return DEFAULT_TREEBANKS[self.stanza_code]
 
     def _is_valid_treebank(self) -> bool:
         """Check whether for chosen language, optional
@@ -349,23 +822,89 @@ class StanzaWrapper:
         KeyError: 'Somehow ``StanzaWrapper.language`` got renamed to something invalid. This should never happen.'
         """
         try:
-            stanza_lang_name = MAP_LANGS_CLTK_STANZA[self.language]
+            return CLTK_TO_STANZA_CODE[self.language]
         except KeyError:
+            if self.language in MAP_LANGS_CLTK_STANZA:
+                raise KeyError("The CLTK's map of ISO-to-Stanza is out of sync.")
             raise KeyError(
                 "Somehow ``StanzaWrapper.language`` got renamed to something invalid. This should never happen."
             )
-        # {'Afrikaans': 'af', 'Ancient_Greek': 'grc', ...}
-        stanza_lang_code: Dict[str, str] = lang2lcode
-        try:
-            return stanza_lang_code[stanza_lang_name]
-        except KeyError:
-            raise KeyError("The CLTK's map of ISO-to-Stanza is out of sync.")
 
     @classmethod
-    def get_nlp(cls, language: str, treebank: Optional[str] = None):
-        if language in cls.nlps:
-            return cls.nlps[language]
-        else:
-            nlp = cls(language, treebank)
-            cls.nlps[language] = nlp
-            return nlp
+    def get_nlp(
+        cls,
+        language: str,
+        treebank: Optional[str] = None,
+        processors: Optional[str] = None,
+        interactive: bool = True,
+    ):
+        """Fetch a cached wrapper for the language-treebank-processors
+        triple, constructing (and caching) one on first request. A
+        language's default treebank is resolved up front so that,
+        e.g., ``get_nlp("grc")`` and ``get_nlp("grc", "proiel")``
+        share one pipeline rather than loading the models twice.
+        ``interactive`` only affects how a missing model download is
+        handled on construction; pass ``False`` from unattended code.
+
+        >>> stanza_wrapper = StanzaWrapper.get_nlp(language="grc")
+        >>> stanza_wrapper is StanzaWrapper.get_nlp(language="grc", treebank="proiel")
+        True
+        """
+        if treebank is None:
+            try:
+                treebank = DEFAULT_TREEBANKS[CLTK_TO_STANZA_CODE[language]]
+            except KeyError:
+                # Let the constructor below raise its usual errors
+                # for unknown languages.
+                pass
+        key = (language, treebank, processors)
+        if key in cls.nlps:
+            cls.nlps.move_to_end(key)
+            return cls.nlps[key]
+        nlp = cls(language, treebank, processors=processors, interactive=interactive)
+        cls.nlps[(language, nlp.treebank, processors)] = nlp
+        while len(cls.nlps) > cls.max_cached_nlps:
+            cls.nlps.popitem(last=False)
+        return nlp
+
+    @classmethod
+    def preload(
+        cls, languages: List[str], treebanks: Optional[List[Optional[str]]] = None
+    ) -> None:
+        """Eagerly construct and cache the pipelines for the given
+        languages, so the first ``parse()`` call does not stall on
+        model loading. Long-lived applications (e.g., a web service)
+        should call this at startup, before accepting requests; the
+        same behavior is available by setting the environment variable
+        ``CLTK_STANZA_PRELOAD`` to a comma-separated list of language
+        codes (e.g., ``"grc,lat"``) before importing the CLTK.
+
+        >>> StanzaWrapper.preload(languages=["grc"])
+        >>> ("grc", "proiel", None) in StanzaWrapper.nlps
+        True
+        """
+        if treebanks is None:
+            treebanks = [None] * len(languages)
+        for language, treebank in zip(languages, treebanks):
+            # Non-interactive: preload runs unattended (often at
+            # import), where a download confirmation prompt would
+            # block on stdin or fail outright on a headless host.
+            wrapper = cls.get_nlp(
+                language=language, treebank=treebank, interactive=False
+            )
+            if not wrapper.server_mode:
+                wrapper.nlp  # force the otherwise-lazy pipeline load
+
+
+_PRELOAD_LANGUAGES = os.environ.get("CLTK_STANZA_PRELOAD")
+if _PRELOAD_LANGUAGES:
+    try:
+        StanzaWrapper.preload(
+            languages=[lang.strip() for lang in _PRELOAD_LANGUAGES.split(",")]
+        )
+    except Exception as preload_error:  # never let preloading break import
+        LOG.warning(
+            "Failed to preload Stanza pipelines for '%s': %s",
+            _PRELOAD_LANGUAGES,
+            preload_error,
+        )